@@ -14,16 +14,15 @@
 # limitations under the License.
 """Filesystem registry managing filesystem plugins."""
 
-from __future__ import absolute_import
-from __future__ import division
-from __future__ import print_function
-
-import re
 import threading
-from typing import Text, Type
+from typing import Tuple, Type
 
 from tfx.dsl.io import filesystem
 
+# Characters allowed in a filesystem scheme name (the part before "://").
+_SCHEME_CHARS = frozenset('abcdefghijklmnopqrstuvwxyz0123456789')
+_SCHEME_SEPARATOR = '://'
+
 
 class FilesystemRegistry(object):
   """Registry of pluggable filesystem implementations used in TFX components."""
@@ -32,6 +31,8 @@ class FilesystemRegistry(object):
     self._preferred_filesystem_by_scheme = {}
     self._filesystem_priority = {}
     self._registration_lock = threading.Lock()
+    # Registered non-empty schemes, longest first, for prefix matching paths.
+    self._remote_schemes = ()  # type: Tuple[str, ...]
 
   def register(self, filesystem_cls: Type[filesystem.Filesystem],
                priority: int) -> None:
@@ -50,9 +51,13 @@ class FilesystemRegistry(object):
         if (not current_preferred or
             priority < self._filesystem_priority[current_preferred]):
           self._preferred_filesystem_by_scheme[scheme] = filesystem_cls
+      self._remote_schemes = tuple(
+          sorted((s for s in self._preferred_filesystem_by_scheme if s),
+                 key=len,
+                 reverse=True))
 
   def get_filesystem_for_scheme(self,
-                                scheme: Text) -> Type[filesystem.Filesystem]:
+                                scheme: str) -> Type[filesystem.Filesystem]:
     """Get filesystem plugin for given scheme string."""
     if scheme not in self._preferred_filesystem_by_scheme:
       raise Exception(
@@ -61,12 +66,16 @@ class FilesystemRegistry(object):
            'enable additional filesystem plugins.') % scheme)
     return self._preferred_filesystem_by_scheme[scheme]
 
-  def get_filesystem_for_path(self, path: Text) -> Type[filesystem.Filesystem]:
+  def get_filesystem_for_path(self, path: str) -> Type[filesystem.Filesystem]:
     """Get filesystem plugin for given path."""
+    # The set of registered schemes is small, so try them as prefixes first.
+    for scheme in self._remote_schemes:
+      if path.startswith(scheme):
+        return self._preferred_filesystem_by_scheme[scheme]
     # Assume local path by default, but extract filesystem prefix if available.
-    result = re.match('^([a-z0-9]+://)', path)
-    if result:
-      scheme = result.group(1)
+    idx = path.find(_SCHEME_SEPARATOR)
+    if idx > 0 and all(c in _SCHEME_CHARS for c in path[:idx]):
+      scheme = path[:idx + len(_SCHEME_SEPARATOR)]
     else:
       scheme = ''
     return self.get_filesystem_for_scheme(scheme)
@@ -49,6 +49,8 @@ class FilesystemRegistryTest(tf.test.TestCase):
     self.assertIs(local.LocalFilesystem, registry.get_filesystem_for_scheme(''))
     self.assertIs(local.LocalFilesystem,
                   registry.get_filesystem_for_path('/tmp/my/file'))
+    self.assertIs(local.LocalFilesystem,
+                  registry.get_filesystem_for_path('/tmp/my://file'))
     with self.assertRaisesRegexp(Exception, 'is not available for use'):
       registry.get_filesystem_for_scheme('gs://')
     with self.assertRaisesRegexp(Exception, 'is not available for use'):
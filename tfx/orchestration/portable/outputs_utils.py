@@ -14,8 +14,10 @@
 """Portable library for output artifacts resolution including caching decision."""
 
 import collections
+import concurrent.futures
 import os
-from typing import Dict, List, Text
+import threading
+from typing import Any, Callable, Dict, List, Optional, Text
 
 from absl import logging
 import tensorflow as tf
@@ -28,33 +30,91 @@ _EXECUTION_PREFIX = 'execution_'
 _STATEFUL_WORKING_DIR = 'stateful_working_dir'
 _EXECUTION_OUTPUT_FILE = 'executor_output.pb'
 _VALUE_ARTIFACT_FILE_NAME = 'value'
+# Maximum number of threads used to create or remove output dirs concurrently.
+_MAX_IO_WORKERS = 32
+
+# Thread pool shared by all output dir operations in this process, created on
+# first use so that thread start-up is not paid on every launcher step.
+_IO_POOL = None  # type: Optional[concurrent.futures.ThreadPoolExecutor]
+# Pid of the process that created _IO_POOL. A forked child does not inherit the
+# pool's worker threads, so it must create its own pool.
+_IO_POOL_PID = None  # type: Optional[int]
+_IO_POOL_LOCK = threading.Lock()
+
+
+def _create_empty_file(uri: Text) -> None:
+  """Creates an empty file at uri, whose parent dir must already exist."""
+  with tf.io.gfile.GFile(uri, 'w') as f:
+    # Because tf.io.gfile.GFile won't create an empty file, we write an
+    # empty string to it to force the creation.
+    f.write('')
+
+
+def _remove_output_dir(artifact: types.Artifact) -> None:
+  """Remove dir (or file for ValueArtifact) of an output artifact's URI."""
+  # Most outputs are dirs, so try rmtree directly instead of checking isdir
+  # first, which would cost an extra metadata RPC on remote filesystems.
+  # Filesystems report a non-dir path as NotFound (e.g. GCS) or
+  # FailedPrecondition, in which case remove it as a file instead.
+  try:
+    tf.io.gfile.rmtree(artifact.uri)
+  except (tf.errors.NotFoundError, tf.errors.FailedPreconditionError):
+    tf.io.gfile.remove(artifact.uri)
+
+
+def _get_io_pool() -> concurrent.futures.ThreadPoolExecutor:
+  """Returns the shared thread pool for filesystem calls, creating it once."""
+  global _IO_POOL, _IO_POOL_PID
+  with _IO_POOL_LOCK:
+    if _IO_POOL is None or _IO_POOL_PID != os.getpid():
+      _IO_POOL = concurrent.futures.ThreadPoolExecutor(
+          max_workers=_MAX_IO_WORKERS, thread_name_prefix='tfx-gfile')
+      _IO_POOL_PID = os.getpid()
+    return _IO_POOL
+
+
+def _run_concurrently(fn: Callable[[Any], None], items: List[Any]) -> None:
+  """Applies fn to every item concurrently, re-raising the first error."""
+  if not items:
+    return
+  if len(items) == 1:
+    # Handing a single call to the pool costs more than it saves.
+    fn(items[0])
+    return
+  # Each call is a blocking filesystem round-trip (an RPC on remote filesystems
+  # like GCS), so overlap them with threads. Consuming the results re-raises
+  # any exception from the workers.
+  list(_get_io_pool().map(fn, items))
+
+
+def _flatten_output_dict(
+    output_dict: Dict[Text, List[types.Artifact]]) -> List[types.Artifact]:
+  """Returns all artifacts in output_dict as a single list."""
+  return [
+      artifact for artifact_list in output_dict.values()
+      for artifact in artifact_list
+  ]
 
 
 def make_output_dirs(output_dict: Dict[Text, List[types.Artifact]]) -> None:
   """Make dirs for output artifacts' URI."""
-  for _, artifact_list in output_dict.items():
-    for artifact in artifact_list:
-      if isinstance(artifact, ValueArtifact):
-        # If it is a ValueArtifact, create a file.
-        artifact_dir = os.path.dirname(artifact.uri)
-        tf.io.gfile.makedirs(artifact_dir)
-        with tf.io.gfile.GFile(artifact.uri, 'w') as f:
-          # Because tf.io.gfile.GFile won't create an empty file, we write an
-          # empty string to it to force the creation.
-          f.write('')
-      else:
-        # Otherwise create a dir.
-        tf.io.gfile.makedirs(artifact.uri)
+  artifacts = _flatten_output_dict(output_dict)
+  # A ValueArtifact is a file, so only its parent dir is needed.
+  value_artifact_uris = [
+      artifact.uri for artifact in artifacts
+      if isinstance(artifact, ValueArtifact)
+  ]
+  dirs = [os.path.dirname(uri) for uri in value_artifact_uris] + [
+      artifact.uri for artifact in artifacts
+      if not isinstance(artifact, ValueArtifact)
+  ]
+  _run_concurrently(tf.io.gfile.makedirs, dirs)
+  _run_concurrently(_create_empty_file, value_artifact_uris)
 
 
 def remove_output_dirs(output_dict: Dict[Text, List[types.Artifact]]) -> None:
   """Remove dirs of output artifacts' URI."""
-  for _, artifact_list in output_dict.items():
-    for artifact in artifact_list:
-      if tf.io.gfile.isdir(artifact.uri):
-        tf.io.gfile.rmtree(artifact.uri)
-      else:
-        tf.io.gfile.remove(artifact.uri)
+  _run_concurrently(_remove_output_dir, _flatten_output_dict(output_dict))
 
 
 class OutputsResolver:
@@ -72,29 +132,32 @@ class OutputsResolver:
     self._node_dir = os.path.join(
         self._pipeline_root,
         pipeline_node.node_info.id)
+    # URIs always use '/' as separator, so build the per-execution paths with
+    # plain string formatting from this prefix.
+    self._execution_dir_prefix = f'{self._node_dir}/{_EXECUTION_PREFIX}'
+
+  def _get_execution_dir(self, execution_id: int) -> Text:
+    """Returns the dir holding the outputs of the given execution."""
+    return f'{self._execution_dir_prefix}{execution_id}'
 
   def generate_output_artifacts(
       self, execution_id: int) -> Dict[Text, List[types.Artifact]]:
     """Generates output artifacts given execution_id."""
     output_artifacts = collections.defaultdict(list)
+    execution_dir = self._get_execution_dir(execution_id)
     for key, output_spec in self._pipeline_node.outputs.outputs.items():
       artifact = artifact_utils.deserialize_artifact(
           output_spec.artifact_spec.type)
-      artifact.uri = os.path.join(self._node_dir,
-                                  _EXECUTION_PREFIX + str(execution_id), key)
+      artifact.uri = f'{execution_dir}/{key}'
       if isinstance(artifact, ValueArtifact):
-        artifact.uri = os.path.join(artifact.uri, _VALUE_ARTIFACT_FILE_NAME)
+        artifact.uri = f'{artifact.uri}/{_VALUE_ARTIFACT_FILE_NAME}'
       # artifact.name will contain the set of information to track its creation
       # and is guaranteed to be idempotent across retires of a node.
-      artifact.name = '{0}:{1}:{2}:{3}:{4}'.format(
-          self._pipeline_info.id,
-          self._pipeline_run_id,
-          self._pipeline_node.node_info.id,
-          key,
-          # The index of this artifact, since we only has one artifact per
-          # output for now, it is always 0.
-          # TODO(b/162331170): Update the "0" to the actual index.
-          0)
+      # The trailing index is the index of this artifact, since we only has one
+      # artifact per output for now, it is always 0.
+      # TODO(b/162331170): Update the "0" to the actual index.
+      artifact.name = (f'{self._pipeline_info.id}:{self._pipeline_run_id}:'
+                       f'{self._pipeline_node.node_info.id}:{key}:0')
       logging.debug('Creating output artifact uri %s as directory',
                     artifact.uri)
       output_artifacts[key].append(artifact)
@@ -103,10 +166,9 @@ class OutputsResolver:
 
   def get_executor_output_uri(self, execution_id: int):
     """Generates executor output uri given execution_id."""
-    execution_dir = os.path.join(self._node_dir,
-                                 _EXECUTION_PREFIX + str(execution_id))
+    execution_dir = self._get_execution_dir(execution_id)
     tf.io.gfile.makedirs(execution_dir)
-    executor_output_uri = os.path.join(execution_dir, _EXECUTION_OUTPUT_FILE)
+    executor_output_uri = f'{execution_dir}/{_EXECUTION_OUTPUT_FILE}'
     return executor_output_uri
 
   def get_stateful_working_directory(self):
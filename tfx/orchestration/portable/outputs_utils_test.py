@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Tests for tfx.orchestration.portable.output_utils."""
+import os
+
+import mock
 import tensorflow as tf
 from tfx.orchestration.portable import outputs_utils
 from tfx.orchestration.portable import test_utils
@@ -160,6 +163,65 @@ class OutputUtilsTest(test_utils.TfxTest):
       for artifact in artifact_list:
         self.assertFalse(tf.io.gfile.exists(artifact.uri))
 
+  def testRemoveOutputDirsFallsBackToRemoveForFiles(self):
+    output_artifacts = self._output_resolver.generate_output_artifacts(1)
+    outputs_utils.make_output_dirs(output_artifacts)
+    value_artifact = output_artifacts['output_3'][0]
+    rmtree = tf.io.gfile.rmtree
+
+    # Simulate a filesystem whose rmtree rejects files, like GCS.
+    def fake_rmtree(path):
+      if not tf.io.gfile.isdir(path):
+        raise tf.errors.NotFoundError(None, None, 'not a directory')
+      rmtree(path)
+
+    with mock.patch.object(tf.io.gfile, 'rmtree', side_effect=fake_rmtree):
+      with mock.patch.object(
+          tf.io.gfile, 'remove', wraps=tf.io.gfile.remove) as mock_remove:
+        outputs_utils.remove_output_dirs(output_artifacts)
+
+    mock_remove.assert_called_once_with(value_artifact.uri)
+    for _, artifact_list in output_artifacts.items():
+      for artifact in artifact_list:
+        self.assertFalse(tf.io.gfile.exists(artifact.uri))
+
+  def testRemoveOutputDirsRaisesRmtreeErrors(self):
+    output_artifacts = self._output_resolver.generate_output_artifacts(1)
+    outputs_utils.make_output_dirs(output_artifacts)
+    permission_denied = tf.errors.PermissionDeniedError(None, None, 'denied')
+
+    with mock.patch.object(
+        tf.io.gfile, 'rmtree', side_effect=permission_denied):
+      with mock.patch.object(tf.io.gfile, 'remove') as mock_remove:
+        with self.assertRaises(tf.errors.PermissionDeniedError):
+          outputs_utils.remove_output_dirs(output_artifacts)
+
+    mock_remove.assert_not_called()
+
+  # pylint: disable=protected-access
+  def testIoPoolIsRecreatedAfterFork(self):
+    # Restore the module's pool afterwards so other tests keep sharing it.
+    saved_pool = outputs_utils._IO_POOL
+    saved_pool_pid = outputs_utils._IO_POOL_PID
+
+    def restore_pool():
+      outputs_utils._IO_POOL = saved_pool
+      outputs_utils._IO_POOL_PID = saved_pool_pid
+
+    self.addCleanup(restore_pool)
+
+    pool = outputs_utils._get_io_pool()
+    if pool is not saved_pool:
+      self.addCleanup(pool.shutdown)
+    self.assertIs(pool, outputs_utils._get_io_pool())
+    # A forked child sees a different pid and must not reuse the parent's pool.
+    with mock.patch.object(
+        outputs_utils.os, 'getpid', return_value=os.getpid() + 1):
+      child_pool = outputs_utils._get_io_pool()
+    self.addCleanup(child_pool.shutdown)
+    self.assertIsNot(pool, child_pool)
+  # pylint: enable=protected-access
+
 
 if __name__ == '__main__':
   tf.test.main()